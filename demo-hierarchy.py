@@ -3,9 +3,9 @@ from v1_builder import *
 def demo_system():
     """Demonstrate the nervous system hierarchy"""
     
-    # Build the complete system
-    builder = NervousSystemBuilder()
-    nervous_system = builder.build_complete_system()
+    # Get the complete system (built once per process)
+    builder = get_builder()
+    nervous_system = get_nervous_system()
     
     # Print hierarchy
     def print_hierarchy(component, indent=0):
@@ -16,18 +16,8 @@ def demo_system():
     print("NERVOUS SYSTEM HIERARCHY:")
     print_hierarchy(nervous_system)
     
-    # Find specific components
-    def find_component(root, name):
-        if root.name == name:
-            return root
-        for child in root.children:
-            result = find_component(child, name)
-            if result:
-                return result
-        return None
-    
     # Example: Find and demonstrate signal processing
-    motor_cortex = find_component(nervous_system, "PrimaryMotorCortex")
+    motor_cortex = builder.find("PrimaryMotorCortex")
     if motor_cortex:
         print(f"\nFound: {motor_cortex.get_path()}")
         
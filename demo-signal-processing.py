@@ -1,22 +1,12 @@
 ############################## BASIC USAGE ##############################
 
-from v1_builder import NervousSystemBuilder, NeuralSignal
+from v1_builder import get_builder, get_nervous_system, NeuralSignal
 
-builder = NervousSystemBuilder()
-nervous_system = builder.build_complete_system()
-
-# Find a specific brain region
-def find_component(root, name):
-    if root.name == name:
-        return root
-    for child in root.children:
-        result = find_component(child, name)
-        if result:
-            return result
-    return None
+builder = get_builder()
+nervous_system = get_nervous_system()
 
 # Get the primary motor cortex
-motor_cortex = find_component(nervous_system, "PrimaryMotorCortex")
+motor_cortex = builder.find("PrimaryMotorCortex")
 print(f"Found: {motor_cortex.get_path()}")
 
 ########################### SIGNAL PROCESSING ###########################
@@ -1,38 +1,171 @@
+import functools
+import sys
+import warnings
 from abc import ABC, abstractmethod
-from typing import List, Any, Optional
-from dataclasses import dataclass, field
+from collections import deque
+from enum import IntEnum
+from typing import Dict, FrozenSet, List, Any, Optional, Sequence, Union
+
+def _cortical_loop(strengths, out, factor, activity):
+    """CorticalArea.process_signal arithmetic over a batch of strengths"""
+    for i in range(strengths.shape[0]):
+        activity += strengths[i] * 0.1
+        if activity > 1.0:
+            activity = 1.0
+        out[i] = strengths[i] * factor
+    return activity
+
+@functools.lru_cache(maxsize=1)
+def _cortical_kernel():
+    """Compile _cortical_loop with Numba on first use (None without Numba)"""
+    try:
+        from numba import njit
+    except ImportError:  # Numba is optional; batches fall back to plain array math
+        return None
+    return njit(cache=True)(_cortical_loop)
+
+class AreaType(IntEnum):
+    """Functional type of a cortical area"""
+    MOTOR = 0
+    SENSORY = 1
+    ASSOCIATION = 2
+    
+    def __str__(self) -> str:
+        # Display as the lowercase name ('motor'), not the integer value
+        return self.name.lower()
+    
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
 
 class NeuralSignal:
     """Represents a signal passing through the nervous system"""
+    __slots__ = ('signal_type', 'strength', 'data')
+    
     def __init__(self, signal_type: str, strength: float, data: Any = None):
-        self.signal_type = signal_type
+        # Only exact str can be interned; other signal types are kept as given
+        self.signal_type = sys.intern(signal_type) if type(signal_type) is str else signal_type
         self.strength = strength
         self.data = data
 
 class NervousSystemComponent(ABC):
     """Abstract base class for all nervous system components"""
+    __slots__ = ('_name', 'parent', '_children', 'connections', 'active', '_path', '_frozen', '_pending',
+                 '_names')
     
     def __init__(self, name: str, parent: Optional['NervousSystemComponent'] = None):
-        self.name = name
+        self._name = name
         self.parent = parent
-        self.children: List['NervousSystemComponent'] = []
+        self._children: Sequence['NervousSystemComponent'] = []
         self.connections: List['NervousSystemComponent'] = []
         self.active = True
+        self._path: Optional[str] = None
+        self._frozen = False
+        self._pending: Optional[tuple] = None  # HIERARCHY specs not yet materialized
+        # Names anywhere in this subtree, computed once frozen (see _subtree_names)
+        self._names: Optional[FrozenSet[str]] = None
+        
+    @property
+    def name(self) -> str:
+        return self._name
+    
+    @name.setter
+    def name(self, name: str):
+        if self._frozen:
+            raise RuntimeError(f"Cannot rename frozen component '{self._name}'")
+        self._name = name
+        self._invalidate_paths()
+        
+    @property
+    def children(self) -> Sequence['NervousSystemComponent']:
+        """Child components, materializing deferred ones on first access"""
+        if self._pending is not None:
+            self._expand()
+        return self._children
+    
+    @children.setter
+    def children(self, children: Sequence['NervousSystemComponent']):
+        if self._frozen:
+            raise RuntimeError(f"Cannot replace children of frozen component '{self.name}'")
+        self._pending = None
+        self._children = children
+        for child in children:
+            child._invalidate_paths()
+        
+    def _expand(self):
+        """Materialize the deferred child specs (their own children stay deferred)"""
+        pending, self._pending = self._pending, None
+        children = list(self._children)
+        for spec in pending:
+            child = _materialize(spec)
+            child.parent = self
+            if self._frozen:
+                # Children of a frozen node must be frozen too, even leaves
+                child._frozen = True
+                child._children = ()
+            children.append(child)
+        self._children = tuple(children) if self._frozen else children
         
     def add_child(self, child: 'NervousSystemComponent'):
         """Add a child component"""
+        if self._frozen:
+            raise RuntimeError(f"Cannot add child to frozen component '{self.name}'")
         child.parent = self
         self.children.append(child)
+        child._invalidate_paths()
         
     def add_connection(self, target: 'NervousSystemComponent'):
         """Add a connection to another component"""
         self.connections.append(target)
         
+    def freeze(self):
+        """Make this subtree's hierarchy read-only, storing children as tuples
+        
+        Connections stay mutable so a built system can still be wired up.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node._children = tuple(node._children)
+            node._frozen = True
+            node._names = None  # May predate changes made while unfrozen
+            stack.extend(node._children)  # Deferred children are frozen as they expand
+        
     def get_path(self) -> str:
-        """Get the full hierarchical path of this component"""
-        if self.parent:
-            return f"{self.parent.get_path()}/{self.name}"
-        return self.name
+        """Get the full hierarchical path of this component (cached)"""
+        if self._path is None:
+            if self.parent:
+                self._path = f"{self.parent.get_path()}/{self.name}"
+            else:
+                self._path = self.name
+        return self._path
+    
+    def _subtree_names(self) -> FrozenSet[str]:
+        """Names anywhere in this frozen subtree, computed post-order on first use
+        
+        Deferred HIERARCHY children contribute their precomputed names, so
+        nothing has to be materialized.
+        """
+        if self._names is None:
+            stack = [(self, False)]
+            while stack:
+                node, visited = stack.pop()
+                if visited:
+                    node._names = frozenset((node._name,)).union(
+                        *(child._names for child in node._children),
+                        *(_SPEC_NAMES[id(spec)] for spec in node._pending or ()),
+                    )
+                elif node._names is None:
+                    stack.append((node, True))
+                    stack.extend((child, False) for child in node._children)
+        return self._names
+    
+    def _invalidate_paths(self):
+        """Drop cached paths for this component and all of its descendants"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node._path = None
+            stack.extend(node._children)
     
     @abstractmethod
     def process_signal(self, signal: NeuralSignal) -> List[NeuralSignal]:
@@ -40,304 +173,339 @@ class NervousSystemComponent(ABC):
         # TODO: IMPLEMENT THIS
         pass
     
-    def send_signal(self, signal: NeuralSignal):
-        """Send a signal to all connected components"""
-        for connection in self.connections:
-            if connection.active:
-                output_signals = connection.process_signal(signal)
-                for output_signal in output_signals:
-                    connection.send_signal(output_signal)
+    def send_signal(self, signal: NeuralSignal, max_deliveries: Optional[int] = 10000) -> int:
+        """Send a signal to all connected components and propagate the outputs
+        
+        Signals keep circulating around cyclic connections, so propagation
+        stops after max_deliveries signals have been processed and a
+        RuntimeWarning reports how many were left undelivered. Pass
+        max_deliveries=None only for acyclic graphs. Returns the number
+        delivered.
+        """
+        queue = deque((connection, signal) for connection in self.connections if connection.active)
+        delivered = 0
+        while queue:
+            if max_deliveries is not None and delivered >= max_deliveries:
+                warnings.warn(
+                    f"send_signal from '{self.name}' stopped after {delivered} deliveries "
+                    f"with {len(queue)} signals still queued",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+                break
+            target, current = queue.popleft()
+            delivered += 1
+            for output_signal in target.process_signal(current):
+                for connection in target.connections:
+                    if connection.active:
+                        queue.append((connection, output_signal))
+        return delivered
 
 class BasicNervousSystemComponent(NervousSystemComponent):
     """Concrete implementation for basic nervous system components"""
+    __slots__ = ()
     
-    def process_signal(self, signal) -> List:
+    def process_signal(self, signal: NeuralSignal) -> List[NeuralSignal]:
         """Basic signal processing - just passes through with slight decay"""
-        if hasattr(signal, 'strength'):
+        try:
             # Create a new signal with reduced strength
-            output_signal = type(signal)(
-                signal.signal_type if hasattr(signal, 'signal_type') else "processed",
-                signal.strength * 0.9 if hasattr(signal, 'strength') else 0.5,
-                signal.data if hasattr(signal, 'data') else None
-            )
-            return [output_signal]
-        return []
+            return [NeuralSignal(signal.signal_type, signal.strength * 0.9, signal.data)]
+        except AttributeError:
+            return []
 
 class BrainRegion(NervousSystemComponent):
     """Base class for brain regions"""
+    __slots__ = ('function', 'activity_level', '_out_type', '_out_tag')
     
     def __init__(self, name: str, function: str, parent=None):
         super().__init__(name, parent)
-        self.function = function
+        self.function = sys.intern(function) if type(function) is str else function
         self.activity_level = 0.0
         
+        # Output signal type and data depend only on this region
+        self._out_type = sys.intern(f"{function}_processed")
+        self._out_tag = f"Processed by {name}"
+        
     def process_signal(self, signal: NeuralSignal) -> List[NeuralSignal]:
         """Default signal processing for brain regions"""
-        self.activity_level = min(1.0, self.activity_level + signal.strength * 0.1)
+        activity = self.activity_level + signal.strength * 0.1
+        self.activity_level = activity if activity < 1.0 else 1.0
         
         # Create output signal based on region's function
         output_signal = NeuralSignal(
-            signal_type=f"{self.function}_processed",
+            signal_type=self._out_type,
             strength=signal.strength * 0.8,  # Some signal decay
-            data=f"Processed by {self.name}"
+            data=self._out_tag
         )
         return [output_signal]
+    
+    def process_batch(self, strengths, signal_type: Optional[str] = None):
+        """Vectorized signal processing over an array-like of signal strengths
+        
+        Requires NumPy. Returns the output strengths as an array;
+        activity_level ends up where processing each signal in turn would
+        leave it.
+        """
+        import numpy as np  # Optional dependency, only needed for batches
+        
+        strengths = np.asarray(strengths, dtype=np.float64)
+        if strengths.size:
+            # Clamping at 1.0 after each step leaves the total increase minus
+            # the largest overshoot of any prefix, so one cumulative sum suffices
+            increase = np.cumsum(strengths) * 0.1
+            self.activity_level = float(increase[-1] + min(self.activity_level, 1.0 - increase.max()))
+        return strengths * 0.8
 
 class CorticalArea(BrainRegion):
     """Specialized class for cortical areas"""
+    __slots__ = ('area_type', 'layers', '_multipliers', '_default_mult')
     
-    def __init__(self, name: str, function: str, area_type: str, parent=None):
+    def __init__(self, name: str, function: str, area_type: Union[AreaType, str], parent=None):
         super().__init__(name, function, parent)
-        self.area_type = area_type  # 'motor', 'sensory', 'association'
+        if isinstance(area_type, str):
+            try:
+                area_type = AreaType[area_type.upper()]  # 'motor', 'sensory', 'association'
+            except KeyError:
+                valid = ", ".join(str(t) for t in AreaType)
+                raise ValueError(f"Unknown area_type {area_type!r}; expected one of: {valid}") from None
+        self.area_type = area_type
         self.layers = 6  # Cortical areas typically have 6 layers
         
+        # Cortical multipliers depend only on area_type, so decide them once
+        self._multipliers: Dict[str, float] = {}
+        self._default_mult = 1.0
+        if area_type == AreaType.MOTOR:
+            self._multipliers['motor_command'] = 1.2  # Amplify motor signals
+        elif area_type == AreaType.SENSORY:
+            self._default_mult = 0.9  # Slight filtering
+        
     def process_signal(self, signal: NeuralSignal) -> List[NeuralSignal]:
-        # Cortical areas have more complex processing
-        processed_signals = super().process_signal(signal)
+        # Cortical areas have more complex processing: the regional decay and
+        # the cortical-specific multiplier are fused into a single factor
+        factor = 0.8 * self._multipliers.get(signal.signal_type, self._default_mult)
+        activity = self.activity_level + signal.strength * 0.1
+        self.activity_level = activity if activity < 1.0 else 1.0
         
-        # Add cortical-specific processing
-        if self.area_type == 'motor' and signal.signal_type == 'motor_command':
-            processed_signals[0].strength *= 1.2  # Amplify motor signals
-        elif self.area_type == 'sensory':
-            processed_signals[0].strength *= 0.9  # Slight filtering
+        output_signal = NeuralSignal(
+            signal_type=self._out_type,
+            strength=signal.strength * factor,
+            data=self._out_tag
+        )
+        return [output_signal]
+    
+    def process_batch(self, strengths, signal_type: Optional[str] = None):
+        """Vectorized cortical processing for a batch sharing one signal_type
+        
+        Runs through a Numba-compiled kernel when Numba is installed; it is
+        compiled on the first call rather than at import.
+        """
+        multiplier = self._multipliers.get(signal_type, self._default_mult)
+        kernel = _cortical_kernel()
+        if kernel is not None:
+            import numpy as np  # Numba depends on NumPy, so it is present here
             
-        return processed_signals
+            strengths = np.asarray(strengths, dtype=np.float64)
+            # The kernel loops over 1-D input; flatten in the same (C) order
+            # the NumPy path accumulates activity in, then restore the shape
+            flat = strengths.ravel()
+            output = np.empty_like(flat)
+            self.activity_level = float(kernel(flat, output, 0.8 * multiplier, self.activity_level))
+            return output.reshape(strengths.shape)
+        
+        output = super().process_batch(strengths, signal_type)
+        if multiplier != 1.0:
+            output *= multiplier
+        return output
+
+def find_component(root: NervousSystemComponent, name: str) -> Optional[NervousSystemComponent]:
+    """Find the first component with the given name (pre-order search)
+    
+    Frozen subtrees, whose names cannot change, are skipped unvisited when
+    their name set does not contain the name.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node._frozen and name not in node._subtree_names():
+            continue
+        if node.name == name:
+            return node
+        stack.extend(reversed(node.children))
+    return None
+
+# Declarative nervous system hierarchy. Each entry is one of
+#   (name, "basic", children)
+#   (name, "region", function, children)
+#   (name, "cortical", function, AreaType, children)
+HIERARCHY = ("NervousSystem", "basic", (
+    # Central Nervous System
+    ("CentralNervousSystem", "basic", (
+        ("Brain", "basic", (
+            ("Cerebrum", "basic", (
+                ("CerebralCortex", "basic", (
+                    ("FrontalLobe", "basic", (
+                        ("PrimaryMotorCortex", "cortical", "motor_control", AreaType.MOTOR, ()),
+                        ("PrefrontalCortex", "cortical", "executive_function", AreaType.ASSOCIATION, ()),
+                        ("BrocasArea", "cortical", "speech_production", AreaType.ASSOCIATION, ()),
+                    )),
+                    ("ParietalLobe", "basic", (
+                        ("PrimarySomatosensoryCortex", "cortical", "touch_processing", AreaType.SENSORY, ()),
+                        ("PosteriorParietalCortex", "cortical", "spatial_processing", AreaType.ASSOCIATION, ()),
+                    )),
+                    ("TemporalLobe", "basic", (
+                        ("PrimaryAuditoryCortex", "cortical", "hearing", AreaType.SENSORY, ()),
+                        ("WernickesArea", "cortical", "language_comprehension", AreaType.ASSOCIATION, ()),
+                        ("Hippocampus", "region", "memory_formation", ()),
+                    )),
+                    ("OccipitalLobe", "basic", (
+                        ("PrimaryVisualCortex", "cortical", "vision", AreaType.SENSORY, ()),
+                        ("VisualAssociationAreas", "cortical", "visual_processing", AreaType.ASSOCIATION, ()),
+                    )),
+                )),
+                ("WhiteMatter", "basic", (
+                    ("CorpusCallosum", "region", "interhemispheric_communication", ()),
+                    ("InternalCapsule", "region", "projection_fibers", ()),
+                )),
+            )),
+            ("Cerebellum", "region", "motor_coordination", (
+                ("PurkinjeLayer", "region", "integration", ()),
+                ("GranuleLayer", "region", "input_processing", ()),
+                ("MolecularLayer", "region", "output_processing", ()),
+            )),
+            ("Brainstem", "basic", (
+                ("Medulla", "region", "vital_functions", (
+                    ("RespiratoryCenter", "region", "breathing_control", ()),
+                    ("CardiacCenter", "region", "heart_rate_control", ()),
+                )),
+                ("Pons", "region", "relay_sleep", (
+                    ("PontineNuclei", "region", "motor_relay", ()),
+                    ("SleepWakeCenters", "region", "sleep_regulation", ()),
+                )),
+                ("Midbrain", "region", "reflexes_reward", (
+                    ("SuperiorColliculus", "region", "visual_reflexes", ()),
+                    ("SubstantiaNigra", "region", "dopamine_production", ()),
+                )),
+            )),
+            ("Diencephalon", "basic", (
+                ("Thalamus", "region", "sensory_relay", (
+                    ("SensoryRelayNuclei", "region", "sensory_processing", ()),
+                    ("MotorRelayNuclei", "region", "motor_processing", ()),
+                )),
+                ("Hypothalamus", "region", "homeostasis", (
+                    ("ParaventricularNucleus", "region", "hormone_regulation", ()),
+                    ("SuprachiasmaticNucleus", "region", "circadian_rhythm", ()),
+                )),
+            )),
+            ("LimbicSystem", "basic", (
+                # Hippocampus (more detailed)
+                ("Hippocampus", "region", "memory_formation", (
+                    ("DentateGyrus", "region", "pattern_separation", ()),
+                    ("CA1_Field", "region", "memory_output", ()),
+                    ("CA3_Field", "region", "pattern_completion", ()),
+                )),
+                ("Amygdala", "region", "fear_emotion", (
+                    ("CentralNucleus", "region", "fear_response", ()),
+                    ("BasolateralComplex", "region", "fear_learning", ()),
+                )),
+            )),
+        )),
+        ("SpinalCord", "basic", tuple(
+            (region_name, "region", "spinal_processing", ())
+            for region_name in ["CervicalRegion", "ThoracicRegion", "LumbarRegion", "SacralRegion"]
+        )),
+    )),
+    # Peripheral Nervous System
+    ("PeripheralNervousSystem", "basic", (
+        ("SomaticNervousSystem", "basic", (
+            ("CranialNerves", "basic", tuple(
+                (nerve_name, "region", "peripheral_relay", ())
+                for nerve_name in ["Olfactory_I", "Optic_II", "Oculomotor_III", "Trigeminal_V",
+                                   "Facial_VII", "Vestibulocochlear_VIII", "Vagus_X"]
+            )),
+        )),
+        ("AutonomicNervousSystem", "basic", (
+            ("SympatheticNervousSystem", "region", "fight_flight", ()),
+            ("ParasympatheticNervousSystem", "region", "rest_digest", ()),
+        )),
+    )),
+))
+
+def _collect_spec_names(root_spec) -> Dict[int, FrozenSet[str]]:
+    """Map the id() of every entry under root_spec to the names in its subtree"""
+    names: Dict[int, FrozenSet[str]] = {}
+    stack = [(root_spec, False)]
+    while stack:
+        spec, visited = stack.pop()
+        if visited:
+            names[id(spec)] = frozenset((spec[0],)).union(*(names[id(child)] for child in spec[-1]))
+        else:
+            stack.append((spec, True))
+            stack.extend((child, False) for child in spec[-1])
+    return names
+
+# Subtree names are known up front, so deferred subtrees can prune searches
+_SPEC_NAMES = _collect_spec_names(HIERARCHY)
+
+_COMPONENT_KINDS = {
+    "basic": BasicNervousSystemComponent,
+    "region": BrainRegion,
+    "cortical": CorticalArea,
+}
+
+def _materialize(spec) -> NervousSystemComponent:
+    """Instantiate a HIERARCHY entry, deferring its children until accessed"""
+    name, kind, *args, children = spec
+    node = _COMPONENT_KINDS[kind](name, *args)
+    if children:
+        node._pending = children
+    return node
 
 class NervousSystemBuilder:
     """Builder class to construct the complete nervous system hierarchy"""
     
     def __init__(self):
         self.root = None
-        
-    def build_complete_system(self) -> NervousSystemComponent:
-        """Build the complete nervous system hierarchy"""
-        
-        # Root system
-        self.root = BasicNervousSystemComponent("NervousSystem")
-        
-        # Central Nervous System
-        cns = BasicNervousSystemComponent("CentralNervousSystem")
-        self.root.add_child(cns)
-        
-        # Build Brain
-        brain = self._build_brain()
-        cns.add_child(brain)
-        
-        # Build Spinal Cord
-        spinal_cord = self._build_spinal_cord()
-        cns.add_child(spinal_cord)
-        
-        # Peripheral Nervous System
-        pns = BasicNervousSystemComponent("PeripheralNervousSystem")
-        self.root.add_child(pns)
-        
-        # Build PNS components
-        somatic = self._build_somatic_system()
-        autonomic = self._build_autonomic_system()
-        pns.add_child(somatic)
-        pns.add_child(autonomic)
-        
+        self._index: Dict[str, Optional[NervousSystemComponent]] = {}
+        
+    def build_complete_system(self, frozen: bool = True) -> NervousSystemComponent:
+        """Build the complete nervous system hierarchy
+        
+        Subtrees are materialized lazily, the first time their children are
+        accessed, so callers only pay for the parts of the system they use.
+        Pass frozen=False to keep the hierarchy open for add_child.
+        """
+        self.root = _materialize(HIERARCHY)
+        if frozen:
+            self.root.freeze()
+        self._index = {}
         return self.root
     
-    def _build_brain(self) -> NervousSystemComponent:
-        """Build the brain hierarchy"""
-        brain = BasicNervousSystemComponent("Brain")
-        
-        # Cerebrum
-        cerebrum = self._build_cerebrum()
-        brain.add_child(cerebrum)
-        
-        # Cerebellum
-        cerebellum = BrainRegion("Cerebellum", "motor_coordination")
-        purkinje_layer = BrainRegion("PurkinjeLayer", "integration", cerebellum)
-        granule_layer = BrainRegion("GranuleLayer", "input_processing", cerebellum)
-        molecular_layer = BrainRegion("MolecularLayer", "output_processing", cerebellum)
-        cerebellum.add_child(purkinje_layer)
-        cerebellum.add_child(granule_layer)
-        cerebellum.add_child(molecular_layer)
-        brain.add_child(cerebellum)
-        
-        # Brainstem
-        brainstem = self._build_brainstem()
-        brain.add_child(brainstem)
-        
-        # Diencephalon
-        diencephalon = self._build_diencephalon()
-        brain.add_child(diencephalon)
-        
-        # Limbic System
-        limbic = self._build_limbic_system()
-        brain.add_child(limbic)
-        
-        return brain
-    
-    def _build_cerebrum(self) -> NervousSystemComponent:
-        """Build cerebrum with cortical areas"""
-        cerebrum = BasicNervousSystemComponent("Cerebrum")
-        
-        # Cerebral Cortex
-        cortex = BasicNervousSystemComponent("CerebralCortex")
-        
-        # Frontal Lobe
-        frontal = BasicNervousSystemComponent("FrontalLobe")
-        motor_cortex = CorticalArea("PrimaryMotorCortex", "motor_control", "motor", frontal)
-        prefrontal = CorticalArea("PrefrontalCortex", "executive_function", "association", frontal)
-        brocas = CorticalArea("BrocasArea", "speech_production", "association", frontal)
-        frontal.add_child(motor_cortex)
-        frontal.add_child(prefrontal)
-        frontal.add_child(brocas)
-        cortex.add_child(frontal)
-        
-        # Parietal Lobe
-        parietal = BasicNervousSystemComponent("ParietalLobe")
-        somatosensory = CorticalArea("PrimarySomatosensoryCortex", "touch_processing", "sensory", parietal)
-        posterior_parietal = CorticalArea("PosteriorParietalCortex", "spatial_processing", "association", parietal)
-        parietal.add_child(somatosensory)
-        parietal.add_child(posterior_parietal)
-        cortex.add_child(parietal)
-        
-        # Temporal Lobe
-        temporal = BasicNervousSystemComponent("TemporalLobe")
-        auditory = CorticalArea("PrimaryAuditoryCortex", "hearing", "sensory", temporal)
-        wernickes = CorticalArea("WernickesArea", "language_comprehension", "association", temporal)
-        hippocampus = BrainRegion("Hippocampus", "memory_formation", temporal)
-        temporal.add_child(auditory)
-        temporal.add_child(wernickes)
-        temporal.add_child(hippocampus)
-        cortex.add_child(temporal)
-        
-        # Occipital Lobe
-        occipital = BasicNervousSystemComponent("OccipitalLobe")
-        visual = CorticalArea("PrimaryVisualCortex", "vision", "sensory", occipital)
-        visual_assoc = CorticalArea("VisualAssociationAreas", "visual_processing", "association", occipital)
-        occipital.add_child(visual)
-        occipital.add_child(visual_assoc)
-        cortex.add_child(occipital)
-        
-        cerebrum.add_child(cortex)
-        
-        # White Matter
-        white_matter = BasicNervousSystemComponent("WhiteMatter")
-        corpus_callosum = BrainRegion("CorpusCallosum", "interhemispheric_communication", white_matter)
-        internal_capsule = BrainRegion("InternalCapsule", "projection_fibers", white_matter)
-        white_matter.add_child(corpus_callosum)
-        white_matter.add_child(internal_capsule)
-        cerebrum.add_child(white_matter)
-        
-        return cerebrum
-    
-    def _build_brainstem(self) -> NervousSystemComponent:
-        """Build brainstem components"""
-        brainstem = BasicNervousSystemComponent("Brainstem")
-        
-        # Medulla
-        medulla = BrainRegion("Medulla", "vital_functions")
-        respiratory = BrainRegion("RespiratoryCenter", "breathing_control", medulla)
-        cardiac = BrainRegion("CardiacCenter", "heart_rate_control", medulla)
-        medulla.add_child(respiratory)
-        medulla.add_child(cardiac)
-        brainstem.add_child(medulla)
-        
-        # Pons
-        pons = BrainRegion("Pons", "relay_sleep")
-        pontine_nuclei = BrainRegion("PontineNuclei", "motor_relay", pons)
-        sleep_centers = BrainRegion("SleepWakeCenters", "sleep_regulation", pons)
-        pons.add_child(pontine_nuclei)
-        pons.add_child(sleep_centers)
-        brainstem.add_child(pons)
-        
-        # Midbrain
-        midbrain = BrainRegion("Midbrain", "reflexes_reward")
-        superior_coll = BrainRegion("SuperiorColliculus", "visual_reflexes", midbrain)
-        substantia_nigra = BrainRegion("SubstantiaNigra", "dopamine_production", midbrain)
-        midbrain.add_child(superior_coll)
-        midbrain.add_child(substantia_nigra)
-        brainstem.add_child(midbrain)
-        
-        return brainstem
-    
-    def _build_diencephalon(self) -> NervousSystemComponent:
-        """Build diencephalon components"""
-        diencephalon = BasicNervousSystemComponent("Diencephalon")
-        
-        # Thalamus
-        thalamus = BrainRegion("Thalamus", "sensory_relay")
-        sensory_relay = BrainRegion("SensoryRelayNuclei", "sensory_processing", thalamus)
-        motor_relay = BrainRegion("MotorRelayNuclei", "motor_processing", thalamus)
-        thalamus.add_child(sensory_relay)
-        thalamus.add_child(motor_relay)
-        diencephalon.add_child(thalamus)
-        
-        # Hypothalamus
-        hypothalamus = BrainRegion("Hypothalamus", "homeostasis")
-        paraventricular = BrainRegion("ParaventricularNucleus", "hormone_regulation", hypothalamus)
-        suprachiasmatic = BrainRegion("SuprachiasmaticNucleus", "circadian_rhythm", hypothalamus)
-        hypothalamus.add_child(paraventricular)
-        hypothalamus.add_child(suprachiasmatic)
-        diencephalon.add_child(hypothalamus)
-        
-        return diencephalon
-    
-    def _build_limbic_system(self) -> NervousSystemComponent:
-        """Build limbic system components"""
-        limbic = BasicNervousSystemComponent("LimbicSystem")
-        
-        # Hippocampus (more detailed)
-        hippocampus = BrainRegion("Hippocampus", "memory_formation")
-        dentate_gyrus = BrainRegion("DentateGyrus", "pattern_separation", hippocampus)
-        ca1 = BrainRegion("CA1_Field", "memory_output", hippocampus)
-        ca3 = BrainRegion("CA3_Field", "pattern_completion", hippocampus)
-        hippocampus.add_child(dentate_gyrus)
-        hippocampus.add_child(ca1)
-        hippocampus.add_child(ca3)
-        limbic.add_child(hippocampus)
-        
-        # Amygdala
-        amygdala = BrainRegion("Amygdala", "fear_emotion")
-        central_nucleus = BrainRegion("CentralNucleus", "fear_response", amygdala)
-        basolateral = BrainRegion("BasolateralComplex", "fear_learning", amygdala)
-        amygdala.add_child(central_nucleus)
-        amygdala.add_child(basolateral)
-        limbic.add_child(amygdala)
-        
-        return limbic
-    
-    def _build_spinal_cord(self) -> NervousSystemComponent:
-        """Build spinal cord regions"""
-        spinal_cord = BasicNervousSystemComponent("SpinalCord")
-        
-        regions = ["CervicalRegion", "ThoracicRegion", "LumbarRegion", "SacralRegion"]
-        for region_name in regions:
-            region = BrainRegion(region_name, "spinal_processing")
-            spinal_cord.add_child(region)
-            
-        return spinal_cord
-    
-    def _build_somatic_system(self) -> NervousSystemComponent:
-        """Build somatic nervous system"""
-        somatic = BasicNervousSystemComponent("SomaticNervousSystem")
-        
-        # Cranial nerves
-        cranial = BasicNervousSystemComponent("CranialNerves")
-        cranial_names = ["Olfactory_I", "Optic_II", "Oculomotor_III", "Trigeminal_V", 
-                        "Facial_VII", "Vestibulocochlear_VIII", "Vagus_X"]
-        for nerve_name in cranial_names:
-            nerve = BrainRegion(nerve_name, "peripheral_relay")
-            cranial.add_child(nerve)
-        somatic.add_child(cranial)
-        
-        return somatic
+    def find(self, name: str) -> Optional[NervousSystemComponent]:
+        """Find the first component with the given name in the built system
+        
+        Only the subtrees searched are built. Hits are cached by name once the
+        system is frozen; an unfrozen system may still be rearranged.
+        """
+        if self.root is None:
+            raise RuntimeError("Call build_complete_system() before find()")
+        node = self._index.get(name)
+        if node is None:
+            node = find_component(self.root, name)
+            if node is not None and self.root._frozen:
+                self._index[name] = node
+        return node
+
+@functools.lru_cache(maxsize=1)
+def get_builder() -> NervousSystemBuilder:
+    """Return a shared builder whose complete system is built on first use
     
-    def _build_autonomic_system(self) -> NervousSystemComponent:
-        """Build autonomic nervous system"""
-        autonomic = BasicNervousSystemComponent("AutonomicNervousSystem")
-        
-        # Sympathetic
-        sympathetic = BrainRegion("SympatheticNervousSystem", "fight_flight")
-        autonomic.add_child(sympathetic)
-        
-        # Parasympathetic
-        parasympathetic = BrainRegion("ParasympatheticNervousSystem", "rest_digest")
-        autonomic.add_child(parasympathetic)
-        
-        return autonomic
\ No newline at end of file
+    The hierarchy is deterministic, so every caller gets the same tree;
+    component state such as activity_level is shared as well.
+    """
+    builder = NervousSystemBuilder()
+    builder.build_complete_system()
+    return builder
+
+def get_nervous_system() -> NervousSystemComponent:
+    """Return the shared complete nervous system (see get_builder)"""
+    return get_builder().root
\ No newline at end of file